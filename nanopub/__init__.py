@@ -1,10 +1,36 @@
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_attributes
 from ._version import __version__
-from .nanopub_conf import NanopubConf
-from .client import NanopubClient
-from .profile import Profile, load_profile, generate_keyfiles
-from .nanopub import Nanopub
-from .templates.nanopub_index import NanopubIndex, create_nanopub_index
-from .templates.nanopub_introduction import NanopubIntroduction
-from .templates.nanopub_claim import NanopubClaim
-from .templates.nanopub_retract import NanopubRetract
-from .templates.nanopub_update import NanopubUpdate
+
+if TYPE_CHECKING:
+    from .client import NanopubClient
+    from .nanopub import Nanopub
+    from .nanopub_conf import NanopubConf
+    from .profile import Profile, generate_keyfiles, load_profile
+    from .templates.nanopub_claim import NanopubClaim
+    from .templates.nanopub_index import NanopubIndex, create_nanopub_index
+    from .templates.nanopub_introduction import NanopubIntroduction
+    from .templates.nanopub_retract import NanopubRetract
+    from .templates.nanopub_update import NanopubUpdate
+
+# Public objects are only imported on first access (PEP 562), so that importing
+# the package (e.g. for `np --help`) does not load rdflib and pycryptodome
+_LAZY = {
+    "NanopubConf": ".nanopub_conf",
+    "NanopubClient": ".client",
+    "Profile": ".profile",
+    "load_profile": ".profile",
+    "generate_keyfiles": ".profile",
+    "Nanopub": ".nanopub",
+    "NanopubIndex": ".templates.nanopub_index",
+    "create_nanopub_index": ".templates.nanopub_index",
+    "NanopubIntroduction": ".templates.nanopub_introduction",
+    "NanopubClaim": ".templates.nanopub_claim",
+    "NanopubRetract": ".templates.nanopub_retract",
+    "NanopubUpdate": ".templates.nanopub_update",
+}
+
+__all__ = ["__version__", *_LAZY]
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY)
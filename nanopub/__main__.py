@@ -2,17 +2,18 @@
 import os
 import re
 import shutil
+from enum import Enum
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import typer
 
-from nanopub import Nanopub, NanopubConf, load_profile
 from nanopub._version import __version__
 from nanopub.definitions import DEFAULT_PROFILE_PATH, USER_CONFIG_DIR
-from nanopub.profile import Profile, ProfileError, generate_keyfiles
-from nanopub.templates.nanopub_introduction import NanopubIntroduction
-from nanopub.utils import MalformedNanopubError
+
+# rdflib, pycryptodome and yatiml are imported inside the commands that need them,
+# to keep `np --help` and `np version` fast
 
 cli = typer.Typer(help="Nanopub Command Line Interface")
 
@@ -22,14 +23,20 @@ DEFAULT_KEYS_PATH_PREFIX = USER_CONFIG_DIR / 'id'
 DEFAULT_PRIVATE_KEY_PATH = USER_CONFIG_DIR / PRIVATE_KEY_FILE
 DEFAULT_PUBLIC_KEY_PATH = USER_CONFIG_DIR / PUBLIC_KEY_FILE
 RSA = 'RSA'
-ORCID_ID_REGEX = r'^https://orcid.org/(\d{4}-){3}\d{3}(\d|X)$'
+ORCID_ID_REGEX = re.compile(r'^https://orcid.org/(\d{4}-){3}\d{3}(\d|X)$', re.ASCII)
+
+
+class SignedFormat(str, Enum):
+    """RDF formats in which `np sign` can write the signed nanopubs"""
+    trig = 'trig'
+    jelly = 'jelly'
 
 
 def validate_orcid_id(ctx, param, orcid_id: str):
     """Check if valid ORCID iD, should be https://orcid.org/ + 16 digit in form:
     https://orcid.org/0000-0000-0000-0000. ctx and param are necessary `click` callback args
     """
-    if re.match(ORCID_ID_REGEX, orcid_id):
+    if ORCID_ID_REGEX.match(orcid_id):
         return orcid_id
     else:
         raise ValueError('Your ORCID iD is not valid, please provide a valid ORCID iD that '
@@ -43,6 +50,8 @@ def version():
 
 @cli.command(help='Get the current user profile info')
 def profile():
+    from nanopub.profile import ProfileError, load_profile
+
     try:
         p = load_profile()
         print(f' 👤 User profile in \033[1m{DEFAULT_PROFILE_PATH}\033[0m')
@@ -54,14 +63,38 @@ def profile():
 
 
 
-@cli.command(help='Sign a Nanopublication')
+@cli.command(help='Sign one or more Nanopublications')
 def sign(
-    filepath: Path,
+    filepaths: List[Path] = typer.Argument(..., help="Nanopub files to sign", exists=True, dir_okay=False),
     private_key: Optional[Path] = typer.Option(
         None, "--private-key", "-k",
-        help="Path to the RSA private key with which the nanopub will be signed."
+        help="Path to the RSA private key with which the nanopub will be signed.",
+        exists=True, dir_okay=False,
+    ),
+    format: SignedFormat = typer.Option(
+        SignedFormat.trig, "--format", "-f",
+        help="RDF format of the signed nanopub files, jelly is a binary format that requires the pyjelly package."
     ),
 ):
+    if format == SignedFormat.jelly and find_spec("pyjelly") is None:
+        raise typer.BadParameter(
+            "the jelly format requires the pyjelly package, install it with: pip install 'nanopub[jelly]'",
+            param_hint="--format",
+        )
+    # The signed file extension always matches the format it is written in, so files
+    # sharing a stem (e.g. a.nq and a.trig) would overwrite each other's signed file
+    signed_filepaths = [
+        filepath.with_name(f"signed.{filepath.name}").with_suffix(f".{format.value}")
+        for filepath in filepaths
+    ]
+    duplicates = {str(path) for path in signed_filepaths if signed_filepaths.count(path) > 1}
+    if duplicates:
+        raise typer.BadParameter(
+            f"several files would be signed to the same output file: {', '.join(sorted(duplicates))}",
+            param_hint="FILEPATHS",
+        )
+    from nanopub import Nanopub, NanopubConf, Profile, load_profile
+
     if private_key:
         config = NanopubConf(
             profile=Profile(
@@ -73,23 +106,25 @@ def sign(
     else:
         config = NanopubConf(profile=load_profile())
 
-    folder_path, filename = os.path.split(filepath)
-    np = Nanopub(
-        conf=config,
-        rdf=filepath
-    )
-    np.sign()
-    signed_filepath = f"{str(folder_path)}/signed.{str(filename)}"
-    np.rdf.serialize(signed_filepath, format='trig')
-    print(f" ✒️  Nanopub signed in \033[1m{signed_filepath}\033[0m with the trusty URI \033[1m{np.source_uri}\033[0m")
-    print(f" 📬️ To publish it run \033[1mnp publish {signed_filepath}\033[0m")
+    # The RSA key is only parsed once for all the files, cf. profile.load_rsa_key
+    for filepath, signed_filepath in zip(filepaths, signed_filepaths):
+        np = Nanopub(
+            conf=config,
+            rdf=filepath
+        )
+        np.sign()
+        np.store(signed_filepath, format=format.value)
+        print(f" ✒️  Nanopub signed in \033[1m{signed_filepath}\033[0m with the trusty URI \033[1m{np.source_uri}\033[0m")
+        print(f" 📬️ To publish it run \033[1mnp publish {signed_filepath}\033[0m")
 
 
 @cli.command(help='Publish a Nanopublication')
 def publish(
-    filepath: Path,
+    filepath: Path = typer.Argument(..., exists=True, dir_okay=False),
     test: bool = typer.Option(False, help="Publish to the test server"),
 ):
+    from nanopub import Nanopub, NanopubConf, load_profile
+
     if test:
         print(" 🧪 Publishing to the test server")
     config = NanopubConf(
@@ -103,9 +138,12 @@ def publish(
 
 
 @cli.command(help='Check if a signed Nanopublication is valid')
-def check(filepath: Path):
-    config = NanopubConf(profile=load_profile())
-    np = Nanopub(conf=config, rdf=filepath)
+def check(filepath: Path = typer.Argument(..., exists=True, dir_okay=False)):
+    from nanopub import Nanopub
+    from nanopub.utils import MalformedNanopubError
+
+    # Checking a nanopub does not need the user profile and its keys
+    np = Nanopub(rdf=filepath)
     try:
         np.is_valid
         print(f"\033[1m✅ Valid nanopub\033[0m {np.source_uri}")
@@ -154,6 +192,8 @@ def setup(
             nanopubs. If empty, new keys will be generated or the ones in the .nanopub folder
             will be used.
     """
+    from nanopub import NanopubConf, NanopubIntroduction, Profile, generate_keyfiles
+
     print('⚙️ Setting up nanopub profile...')
     if keypair == (None, None):
         keypair = None
@@ -198,8 +238,9 @@ def setup(
 
         # Copy the keypair to the default location
         if not os.path.exists(DEFAULT_PUBLIC_KEY_PATH):
-            shutil.copy(public_key_path, USER_CONFIG_DIR / PUBLIC_KEY_FILE)
+            shutil.copyfile(public_key_path, USER_CONFIG_DIR / PUBLIC_KEY_FILE)
         if not os.path.exists(DEFAULT_PRIVATE_KEY_PATH):
+            # Also copy the permission bits, to keep the private key as restricted as the original
             shutil.copy(private_key, USER_CONFIG_DIR / PRIVATE_KEY_FILE)
 
         print(f'🚚 Your RSA keys have been copied to {USER_CONFIG_DIR}')
@@ -233,7 +274,12 @@ def setup(
 
 
 def _rsa_keys_exist():
-    return DEFAULT_PRIVATE_KEY_PATH.exists() or DEFAULT_PUBLIC_KEY_PATH.exists()
+    # A single directory listing instead of one stat per key file
+    try:
+        with os.scandir(USER_CONFIG_DIR) as entries:
+            return any(entry.name in (PRIVATE_KEY_FILE, PUBLIC_KEY_FILE) for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
 
 
 if __name__ == '__main__':
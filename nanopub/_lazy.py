@@ -0,0 +1,28 @@
+"""Helper to import the attributes of a module on first access (PEP 562)."""
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_attributes(module_name: str, attributes: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the module `__getattr__` and `__dir__` functions to load attributes on first access.
+
+    Args:
+        module_name: the `__name__` of the module using the lazy attributes
+        attributes: mapping of each attribute name to the (relative) module defining it
+
+    Returns:
+        The `__getattr__` and `__dir__` functions to define in the module.
+    """
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        module = importlib.import_module(attributes[name], module_name)
+        value = getattr(module, name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(attributes))
+
+    return __getattr__, __dir__
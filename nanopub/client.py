@@ -19,7 +19,7 @@ from nanopub.definitions import (
 )
 from nanopub.nanopub import Nanopub
 from nanopub.nanopub_conf import NanopubConf
-from nanopub.utils import log
+from nanopub.utils import http_session, log
 
 DUMMY_NAMESPACE = rdflib.Namespace(DUMMY_NANOPUB_URI + "#")
 NP_URI = DUMMY_NAMESPACE[""]
@@ -222,7 +222,7 @@ class NanopubClient:
         """Query a specific nanopub server grlc endpoint."""
         headers = {"Accept": "application/json"}
         url = grlc_url + endpoint
-        return requests.get(url, params=params, headers=headers)
+        return http_session.get(url, params=params, headers=headers)
 
 
     def _query_grlc_try_servers(
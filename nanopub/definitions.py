@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from rdflib import Namespace
+from nanopub._lazy import lazy_attributes
 
 ROOT_FILEPATH = Path(__file__).parent.parent
 TESTS_FILEPATH = ROOT_FILEPATH / "tests"
@@ -20,10 +20,18 @@ NANOPUB_SERVER_LIST = [
     'http://server.np.dumontierlab.com/',
 ]
 NANOPUB_FETCH_FORMAT = "trig"
+# RDF formats used to parse nanopub files, by file extension. Passing the format
+# explicitly skips rdflib format guessing, and covers the extensions it cannot guess.
+# Jelly files are decoded by the pyjelly plugin straight into the graph, frame by frame
+NANOPUB_FILE_FORMATS = {
+    ".trig": "trig",
+    ".nq": "nquads",
+    ".jelly": "jelly",
+    ".xml": "trix",
+    ".trix": "trix",
+}
 
 DUMMY_NANOPUB_URI = "http://purl.org/nanopub/temp/np"
-DUMMY_NAMESPACE = Namespace(DUMMY_NANOPUB_URI + "#")
-DUMMY_URI = DUMMY_NAMESPACE[""]
 
 NP_TEMP_PREFIX = "http://purl.org/nanopub/temp/"
 NP_PURL = "http://purl.org/np/"
@@ -43,3 +51,9 @@ NANOPUB_GRLC_URLS = [
     # "http://grlc.np.scify.org/api/local/local/",
 ]
 NANOPUB_TEST_GRLC_URL = "http://test-grlc.nanopubs.lod.labs.vu.nl/api/local/local/"
+
+# Kept for backward compatibility, these rdflib objects are now defined in nanopub.utils
+__getattr__, __dir__ = lazy_attributes(__name__, {
+    "DUMMY_NAMESPACE": "nanopub.utils",
+    "DUMMY_URI": "nanopub.utils",
+})
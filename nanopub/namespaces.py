@@ -1,28 +1,40 @@
 """
 This module holds handy namespaces that are often used in nanopublications.
 """
-from rdflib import Namespace
+from functools import lru_cache
 
-NP = Namespace("http://www.nanopub.org/nschema#")
+from rdflib import Namespace, URIRef
+
+
+class CachedNamespace(Namespace):
+    """A Namespace that creates each of its terms once, e.g. `NPX.hasPublicKey` always
+    returns the same URIRef instead of building and validating a new one at each access"""
+
+    @lru_cache(maxsize=1024)
+    def term(self, name: str) -> URIRef:
+        return super().term(name)
+
+
+NP = CachedNamespace("http://www.nanopub.org/nschema#")
 """Nanopub namespace"""
 
-NPX = Namespace("http://purl.org/nanopub/x/")
+NPX = CachedNamespace("http://purl.org/nanopub/x/")
 """Nanopub/x namespace"""
 
-NTEMPLATE = Namespace("https://w3id.org/np/o/ntemplate/")
+NTEMPLATE = CachedNamespace("https://w3id.org/np/o/ntemplate/")
 """Nanopub template namespace"""
 
-PROV = Namespace("http://www.w3.org/ns/prov#")
+PROV = CachedNamespace("http://www.w3.org/ns/prov#")
 """Provenance Ontogoly (PROV-O) namespace"""
 
-HYCL = Namespace("http://purl.org/petapico/o/hycl#")
+HYCL = CachedNamespace("http://purl.org/petapico/o/hycl#")
 """HYCL namespace for claims and hypothesis"""
 
-ORCID = Namespace("https://orcid.org/")
+ORCID = CachedNamespace("https://orcid.org/")
 """ORCID namespace"""
 
-PAV = Namespace("http://purl.org/pav/")
+PAV = CachedNamespace("http://purl.org/pav/")
 """Provenance And Versioning namespace"""
 
-PMID = Namespace("http://www.ncbi.nlm.nih.gov/pubmed/")
+PMID = CachedNamespace("http://www.ncbi.nlm.nih.gov/pubmed/")
 """PubMed namespace"""
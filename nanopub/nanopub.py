@@ -9,16 +9,20 @@ from pathlib import Path
 from typing import Optional, Union
 
 import rdflib
-import requests
-from rdflib import BNode, ConjunctiveGraph, Graph, URIRef
+from rdflib import BNode, ConjunctiveGraph, Dataset, Graph, URIRef
 from rdflib.namespace import DC, DCTERMS, FOAF, PROV, RDF, XSD
 
-from nanopub.definitions import MAX_TRIPLES_PER_NANOPUB, NANOPUB_FETCH_FORMAT, NANOPUB_TEST_SERVER
+from nanopub.definitions import (
+    MAX_TRIPLES_PER_NANOPUB,
+    NANOPUB_FETCH_FORMAT,
+    NANOPUB_FILE_FORMATS,
+    NANOPUB_TEST_SERVER,
+)
 from nanopub.namespaces import HYCL, NP, NPX, NTEMPLATE, ORCID, PAV
 from nanopub.nanopub_conf import NanopubConf
 from nanopub.profile import ProfileError
 from nanopub.sign_utils import add_signature, publish_graph, verify_signature, verify_trusty
-from nanopub.utils import MalformedNanopubError, NanopubMetadata, extract_np_metadata, log
+from nanopub.utils import MalformedNanopubError, NanopubMetadata, extract_np_metadata, http_session, log
 
 
 class Nanopub:
@@ -61,11 +65,11 @@ class Nanopub:
         # source URI, rdflib graph, or file
         if source_uri:
             # If source URI provided we retrieve the nanopub from the servers
-            r = requests.get(source_uri + "." + NANOPUB_FETCH_FORMAT)
+            r = http_session.get(source_uri + "." + NANOPUB_FETCH_FORMAT)
             if not r.ok and self._conf.use_test_server:
                 nanopub_id = source_uri.rsplit("/", 1)[-1]
                 uri_test = NANOPUB_TEST_SERVER + nanopub_id
-                r = requests.get(uri_test + "." + NANOPUB_FETCH_FORMAT)
+                r = http_session.get(uri_test + "." + NANOPUB_FETCH_FORMAT)
             r.raise_for_status()
             self._rdf = self._preformat_graph(ConjunctiveGraph())
             self._rdf.parse(data=r.text, format=NANOPUB_FETCH_FORMAT)
@@ -78,7 +82,7 @@ class Nanopub:
                 self._metadata = extract_np_metadata(self._rdf)
             elif isinstance(rdf, Path):
                 self._rdf = self._preformat_graph(ConjunctiveGraph())
-                self._rdf.parse(rdf)
+                self._rdf.parse(rdf, format=NANOPUB_FILE_FORMATS.get(rdf.suffix.lower()))
                 self._metadata = extract_np_metadata(self._rdf)
             else:
                 self._rdf = self._preformat_graph(ConjunctiveGraph())
@@ -230,7 +234,12 @@ class Nanopub:
 
     def store(self, filepath: Path, format: str = 'trig') -> None:
         """Store the Nanopub object at the given path"""
-        self._rdf.serialize(filepath, format=format)
+        rdf = self._rdf
+        if format == 'jelly':
+            # pyjelly only writes the named graphs (quads) of a Dataset
+            rdf = Dataset(store=self._rdf.store)
+            rdf.namespace_manager = self._rdf.namespace_manager
+        rdf.serialize(filepath, format=format)
 
 
     @property
@@ -1,17 +1,15 @@
 from base64 import decodebytes, encodebytes
 
-import requests
 from Crypto.Hash import SHA256
-from Crypto.PublicKey import RSA
 from Crypto.Signature import PKCS1_v1_5
 from rdflib import BNode, ConjunctiveGraph, Literal, Namespace, URIRef
 
 from nanopub.definitions import NANOPUB_SERVER_LIST, NP_PURL, NP_TEMP_PREFIX
 from nanopub.namespaces import NPX
-from nanopub.profile import Profile
+from nanopub.profile import Profile, load_rsa_key
 from nanopub.trustyuri.rdf import RdfHasher, RdfUtils
 from nanopub.trustyuri.rdf.RdfPreprocessor import transform
-from nanopub.utils import MalformedNanopubError, extract_np_metadata, log
+from nanopub.utils import MalformedNanopubError, extract_np_metadata, http_session, log
 
 
 def add_signature(g: ConjunctiveGraph, profile: Profile, dummy_namespace: Namespace, pubinfo_uri: URIRef) -> ConjunctiveGraph:
@@ -45,7 +43,7 @@ def add_signature(g: ConjunctiveGraph, profile: Profile, dummy_namespace: Namesp
     # print(f"NORMED RDF STARTS\n{normed_rdf}\nNORMED RDF ENDS")
 
     # Sign the normalized RDF with the private RSA key
-    private_key = RSA.import_key(decodebytes(profile.private_key.encode()))
+    private_key = load_rsa_key(profile.private_key)
     signer = PKCS1_v1_5.new(private_key)
     signature_b = signer.sign(SHA256.new(normed_rdf.encode()))
     signature = encodebytes(signature_b).decode().replace("\n", "")
@@ -111,7 +109,7 @@ def publish_graph(g: ConjunctiveGraph, use_server: str = NANOPUB_SERVER_LIST[0])
     headers = {'Content-Type': 'application/trig'}
     # Used by nanopub-java: {'Content-Type': 'application/x-www-form-urlencoded'}
     data = g.serialize(format="trig")
-    r = requests.post(use_server, headers=headers, data=data.encode('utf-8'))
+    r = http_session.post(use_server, headers=headers, data=data.encode('utf-8'))
     r.raise_for_status()
     # if r.status_code == 201:
     return True
@@ -148,7 +146,7 @@ def verify_signature(g: ConjunctiveGraph, source_namespace: Namespace) -> bool:
     )
 
     # Verify signature using the normalized RDF
-    key = RSA.import_key(decodebytes(str(np_sig.public_key).encode()))
+    key = load_rsa_key(str(np_sig.public_key))
     hash_value = SHA256.new(normed_rdf.encode())
     verifier = PKCS1_v1_5.new(key)
     try:
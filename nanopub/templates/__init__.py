@@ -1,5 +1,24 @@
-from .nanopub_claim import NanopubClaim
-from .nanopub_index import NanopubIndex, create_nanopub_index
-from .nanopub_introduction import NanopubIntroduction
-from .nanopub_retract import NanopubRetract
-from .nanopub_update import NanopubUpdate
+from typing import TYPE_CHECKING
+
+from nanopub._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .nanopub_claim import NanopubClaim
+    from .nanopub_index import NanopubIndex, create_nanopub_index
+    from .nanopub_introduction import NanopubIntroduction
+    from .nanopub_retract import NanopubRetract
+    from .nanopub_update import NanopubUpdate
+
+# Loading one template should not import all the others
+_LAZY = {
+    "NanopubClaim": ".nanopub_claim",
+    "NanopubIndex": ".nanopub_index",
+    "create_nanopub_index": ".nanopub_index",
+    "NanopubIntroduction": ".nanopub_introduction",
+    "NanopubRetract": ".nanopub_retract",
+    "NanopubUpdate": ".nanopub_update",
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY)
@@ -15,17 +15,16 @@ def normalize_quads(quads, hashstr=None, baseuri=None):
     quads = preprocess(quads, hashstr=hashstr, baseuri=baseuri)
     comp = StatementComparator(hashstr)
     quads = sorted(quads, key=cmp_to_key(lambda q1, q2: comp.compare(q1, q2)))
-    s = ""
+    # Collect the serialized quads in a list and join them once, instead of
+    # concatenating them to the string one quad at a time
+    parts = []
     previous = ""
     for q in quads:
-        e = ""
-        e = e + str(value_to_string(q[0]))
-        e = e + str(value_to_string(q[1]))
-        e = e + str(value_to_string(q[2]))
-        e = e + str(value_to_string(q[3]))
+        e = value_to_string(q[0]) + value_to_string(q[1]) + value_to_string(q[2]) + value_to_string(q[3])
         if not e == previous:
-            s = s + e
+            parts.append(e)
         previous = e
+    s = "".join(parts)
     log.debug(f"Normalized quads before signing/hashing:\n{s}")
     return s
 
@@ -3,12 +3,19 @@ import re
 from dataclasses import asdict, dataclass
 from typing import Optional
 
+import requests
 from rdflib import ConjunctiveGraph, Namespace, URIRef
 
-from nanopub.definitions import DUMMY_NAMESPACE, DUMMY_URI
+from nanopub.definitions import DUMMY_NANOPUB_URI
 
 log = logging.getLogger()
 
+DUMMY_NAMESPACE = Namespace(DUMMY_NANOPUB_URI + "#")
+DUMMY_URI = DUMMY_NAMESPACE[""]
+
+# HTTP session shared by all calls to the nanopub servers, to reuse their TCP/TLS connections
+http_session = requests.Session()
+
 
 class MalformedNanopubError(ValueError):
     """Error to be raised if a Nanopub is not formed correctly."""
@@ -1,4 +1,7 @@
 import os
+import shutil
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -24,6 +27,7 @@ def test_validate_orcid_id():
                    'https://orcid.org/1234-5678-1234-567',
                    'https://orcid.org/1234-5678-1234-56789',
                    'https://other-url.org/1234-5678-1234-5678',
+                   'https://orcid.org/\u0661\u0662\u0663\u0664-5678-1234-5678',
                    '0000-0000-0000-0000']
     for orcid_id in invalid_ids:
         with pytest.raises(ValueError):
@@ -69,7 +73,86 @@ def test_sign_with_key():
     assert "Nanopub signed in" in result.stdout
 
 
+def test_sign_multiple_files(tmp_path):
+    test_files = [
+        shutil.copy("./tests/testsuite/valid/plain/simple1.trig", tmp_path),
+        shutil.copy("./tests/testsuite/valid/plain/aida1.trig", tmp_path),
+    ]
+    result = runner.invoke(cli, [
+        "sign", *test_files,
+        "-k", PRIVATE_KEY_PATH,
+    ])
+    assert result.exit_code == 0
+    assert result.stdout.count("Nanopub signed in") == 2
+    assert (tmp_path / "signed.simple1.trig").exists()
+    assert (tmp_path / "signed.aida1.trig").exists()
+
+
+def test_sign_multiple_files_same_output(tmp_path):
+    test_files = [
+        shutil.copy("./tests/testsuite/valid/plain/simple1.nq", tmp_path),
+        shutil.copy("./tests/testsuite/valid/plain/simple1.trig", tmp_path),
+    ]
+    result = runner.invoke(cli, [
+        "sign", *test_files,
+        "-k", PRIVATE_KEY_PATH,
+    ])
+    assert result.exit_code == 2
+    assert "several files would be signed" in result.output
+    assert not (tmp_path / "signed.simple1.trig").exists()
+
+
+def test_sign_with_key_jelly(tmp_path):
+    pytest.importorskip("pyjelly")
+    test_file = shutil.copy("./tests/testsuite/valid/plain/simple1.trig", tmp_path)
+    result = runner.invoke(cli, [
+        "sign", test_file,
+        "-k", PRIVATE_KEY_PATH,
+        "--format", "jelly",
+    ])
+    assert result.exit_code == 0
+    assert (tmp_path / "signed.simple1.jelly").exists()
+
+
+def test_sign_nquads_to_trig(tmp_path):
+    test_file = shutil.copy("./tests/testsuite/valid/plain/simple1.nq", tmp_path)
+    result = runner.invoke(cli, [
+        "sign", test_file,
+        "-k", PRIVATE_KEY_PATH,
+    ])
+    assert result.exit_code == 0
+    signed_file = tmp_path / "signed.simple1.trig"
+    assert signed_file.exists()
+
+    result = runner.invoke(cli, ["check", str(signed_file)])
+    assert "Valid nanopub" in result.stdout
+
+
+def test_sign_file_not_found():
+    result = runner.invoke(cli, [
+        "sign", "./tests/testsuite/valid/plain/not-a-file.trig",
+        "-k", PRIVATE_KEY_PATH,
+    ])
+    assert result.exit_code == 2
+    assert "does not exist" in result.output
+
+
+def test_check():
+    test_file = "./tests/testsuite/valid/signed/simple1-signed-rsa.trig"
+    result = runner.invoke(cli, [
+        "check", test_file,
+    ])
+    assert result.exit_code == 0
+    assert "Valid nanopub" in result.stdout
+
+
 def test_version():
     result = runner.invoke(cli, ["version"])
     assert result.exit_code == 0
     assert __version__ == result.stdout.strip()
+
+
+def test_cli_import_is_lightweight():
+    # Importing the CLI (e.g. for `np --help`) should not load the heavy dependencies
+    code = "import nanopub.__main__, sys; assert not {'rdflib', 'Crypto', 'yatiml'} & set(sys.modules)"
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -4,7 +4,7 @@ from pathlib import Path
 import pytest
 
 from nanopub.definitions import TEST_RESOURCES_FILEPATH
-from nanopub.profile import Profile, ProfileError, load_profile
+from nanopub.profile import Profile, ProfileError, load_profile, load_rsa_key
 from tests.conftest import profile_test_path
 
 TEST_PRIVATE_KEY = 'MIICeAIBADANBgkqhkiG9w0BAQEFAASCAmIwggJeAgEAAoGBAPdEfIdHtZYoFh6/DWorzoHpFXMjugqW+CGpe9uk4BfUq54MToi2u7fgdGGtXLg4wsJFBYETdVeS0p1uA7EPe8LhwjHPktf5c6AZbO/lYpKM59e7/Ih4mvOy4iTIe/Dv+1OgasTSK0nXAbKUm/5iJ6LOYa82JQeE/QnT5gUw2e97AgMBAAECgYBbNQnyJINYpeSy5qoeFZaQ2Ncup2kCavmQASJMvJ5ka+/51nRJfY30n3iOZxIiad19J1SGbhUEfoXtyBzYfOubF2i2GJtdF5VyjdSoU6w/gOo2/vnbH+GCHnMclrWshohOADGQU/Y8pYhIvlQqcb6xEOts9m9C9g4uwvPXqjmhoQJBAPkmSFIZwF3i2UvJlHyeXi599L0jkGTUJy/Y4IjieUx5suwvAtG47ejhgIPKK06VtW49oGPHWjWc3cJAmnV+vTMCQQD+EPTvNtLpX9QiDEJD7b8woDwmVrvH/RUosP/cXpMQd7BUVgPlpffAlFJGDlOzwwjZjy+8kc6MYevh1kWqobSZAkEAyCs+nV99ErEHnYEFoB1oU3f0oeSpxKhCF4np03AIvi1kV6bpX+9wjNJnevp5UriqvDgc3S0zx7EQ5Vkb/1vkywJBAMMw59y4tAVT+DhITsi9aTvEfzG9RPt6trzSb2Aw0K/AJJpGkyvl/JfZ2/Oyoh/jYXM0DKrFIni76mtRIajcH1ECQQCJi6aXOaRkRPmf7FYY9cRaJdR1BtZkKZbDg6ZMD1bY97cGiM9STTMeldYcCtQBtyhVCTEObI/V6/0FAvY9Zi7w'
@@ -128,3 +128,36 @@ def test_generate_keys_store_profile(tmpdir):
 
     p2 = load_profile(profile_path)
     assert p2.private_key == p.private_key
+
+
+def test_load_profile_fresh(tmpdir):
+    test_folder = Path(tmpdir)
+    p = Profile(
+        name='Python Tests',
+        orcid_id='https://orcid.org/0000-0000-0000-0000',
+        private_key=TEST_PRIVATE_KEY,
+        public_key=TEST_PUBLIC_KEY
+    )
+    profile_path = p.store(test_folder)
+
+    # Changing a loaded profile does not change the profile loaded next
+    loaded = load_profile(profile_path)
+    loaded.name = 'Changed in memory'
+    assert load_profile(profile_path).name == 'Python Tests'
+
+    p.name = 'Python Tests updated'
+    p.store(test_folder)
+    assert load_profile(profile_path).name == 'Python Tests updated'
+
+
+def test_load_rsa_key_cached():
+    key = load_rsa_key(TEST_PRIVATE_KEY)
+    assert key.has_private()
+    assert load_rsa_key(TEST_PRIVATE_KEY) is key
+
+    p = Profile(
+        name='Python Tests',
+        orcid_id='https://orcid.org/0000-0000-0000-0000',
+        private_key=TEST_PRIVATE_KEY,
+    )
+    assert p.public_key == TEST_PUBLIC_KEY
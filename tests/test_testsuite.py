@@ -1,13 +1,37 @@
 from pathlib import Path
 
+import pytest
 from rdflib import ConjunctiveGraph
 
 from nanopub import Nanopub
+from nanopub.definitions import NANOPUB_FILE_FORMATS
 from nanopub.utils import MalformedNanopubError
 from tests.conftest import java_wrap, testsuite_conf
 
+SIGN_TEST_FILES = [
+    "./tests/testsuite/transform/signed/rsa-key1/simple1.in.trig",
+    "./tests/testsuite/transform/trusty/aida1.in.trig",
+    "./tests/testsuite/transform/trusty/simple1.in.trig",
+    "./tests/testsuite/valid/plain/aida1.trig",
+    "./tests/testsuite/valid/plain/simple1.nq",
+    "./tests/testsuite/valid/plain/simple1.trig",
+    "./tests/testsuite/valid/plain/simple1.xml",
+]
+
+
+@pytest.fixture(scope="module")
+def testsuite_graphs():
+    """Parse the plain nanopubs of the testsuite once for all the tests of this module"""
+    test_files = [str(f) for f in Path("./tests/testsuite/valid/plain").rglob('*') if "/signed." not in str(f)]
+    graphs = {}
+    for test_file in set(test_files + SIGN_TEST_FILES):
+        np_g = ConjunctiveGraph()
+        np_g.parse(test_file, format=NANOPUB_FILE_FORMATS.get(Path(test_file).suffix))
+        graphs[str(Path(test_file))] = np_g
+    return graphs
+
 
-def test_testsuite_valid_plain():
+def test_testsuite_valid_plain(testsuite_graphs):
     test_files = Path("./tests/testsuite/valid/plain").rglob('*')
 
     for test_file in test_files:
@@ -15,15 +39,9 @@ def test_testsuite_valid_plain():
         if "/signed." in str(test_file):
             continue
 
-        np_g = ConjunctiveGraph()
-        if str(test_file).endswith(".xml"):
-            np_g.parse(test_file, format="trix")
-        else:
-            np_g.parse(test_file)
-
         np = Nanopub(
             conf=testsuite_conf,
-            rdf=np_g
+            rdf=testsuite_graphs[str(test_file)]
         )
         assert np.is_valid
 
@@ -62,26 +80,14 @@ def test_testsuite_valid_trusty():
 
 
 
-def test_testsuite_sign_valid():
+def test_testsuite_sign_valid(testsuite_graphs):
     """Test to sign various files from transform and valid folder.
     Compare the generated trusty URI to the one generated by nanopub-java"""
-    test_files = [
-        "./tests/testsuite/transform/signed/rsa-key1/simple1.in.trig",
-        "./tests/testsuite/transform/trusty/aida1.in.trig",
-        "./tests/testsuite/transform/trusty/simple1.in.trig",
-        "./tests/testsuite/valid/plain/aida1.trig",
-        "./tests/testsuite/valid/plain/simple1.nq",
-        "./tests/testsuite/valid/plain/simple1.trig",
-        "./tests/testsuite/valid/plain/simple1.xml",
-    ]
-
-    for test_file in test_files:
+    for test_file in SIGN_TEST_FILES:
         print(f'✒️ Testing signing valid nanopub: {test_file}')
+        # Signing updates the graph in place, so sign a copy of the shared graph
         np_g = ConjunctiveGraph()
-        if test_file.endswith(".xml"):
-            np_g.parse(test_file, format="trix")
-        else:
-            np_g.parse(test_file)
+        np_g.addN((s, p, o, c.identifier) for s, p, o, c in testsuite_graphs[str(Path(test_file))].quads())
 
         np = Nanopub(
             conf=testsuite_conf,
@@ -113,6 +119,25 @@ def test_testsuite_valid_signature():
         assert np.has_valid_trusty
 
 
+def test_testsuite_store_jelly(tmp_path):
+    pytest.importorskip("pyjelly")
+    np = Nanopub(
+        conf=testsuite_conf,
+        rdf=Path("./tests/testsuite/valid/plain/simple1.trig")
+    )
+    np.sign()
+    jelly_file = tmp_path / "signed.simple1.jelly"
+    np.store(jelly_file, format="jelly")
+
+    np2 = Nanopub(
+        conf=testsuite_conf,
+        rdf=jelly_file
+    )
+    assert np2.is_valid
+    assert np2.has_valid_signature
+    assert np2.source_uri == np.source_uri
+
+
 def test_testsuite_invalid_plain():
     test_files = Path("./tests/testsuite/invalid/plain").rglob('*')
 